@@ -1,22 +1,134 @@
+import functools
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
+import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, font as tkfont
 
-LETTER_CHOICES = ["A", "B", "C", "D"]
+try:
+    import orjson  # optional: much faster C parser for big quiz files
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: incremental parser for very large quiz arrays
+except ImportError:
+    ijson = None
+
+# Below this size the one-shot parser wins; ijson pays per-item overhead.
+_STREAM_THRESHOLD = 1 << 20  # 1 MiB
+
+LETTER_CHOICES = ("A", "B", "C", "D")
+
+# First answer letter in either case; the compiled pattern scans in C rather
+# than a Python-level per-character loop.
+_ANS_RE = re.compile(r"[ABCDabcd]")
+
+# Upper/lower letter pairs so the options loop can test "A)"-style prefixes
+# with two character compares — no temporary strings at all.
+_OPT_LETTERS = tuple((ch, ch.lower()) for ch in LETTER_CHOICES)
+
+# Pre-built label strings so hot paths concatenate or reuse instead of
+# re-running f-string formatting per call.
+_OPT_LABELS = tuple(f"{ch})" for ch in LETTER_CHOICES)     # "A)".."D)"
+_OPT_PREFIXES = tuple(f"{ch}) " for ch in LETTER_CHOICES)  # "A) ".."D) "
+
+def _normalize_options(raw):
+    """Turn four raw option values into display strings with "A)".."D)"
+    prefixes (kept as-is when already labeled in either case)."""
+    return tuple(
+        t if len(t) >= 2 and t[0] in _OPT_LETTERS[i] and t[1] == ")" else _OPT_PREFIXES[i] + t
+        for i, t in enumerate(str(opt).strip() for opt in raw[:4])
+    )
+
+# Cheap metadata-title sniff for the library list: v2 files keep metadata near
+# the top, so the first few KiB usually contain it without a full parse.
+_TITLE_RE = re.compile(rb'"title"\s*:\s*"([^"\\]{1,200})"')
+
+def _strip_jsonc(text: str) -> str:
+    """Strip // and /* */ comments and trailing commas in one left-to-right
+    pass. String literals are honored (including \\ escapes), so a // inside a
+    quoted value survives — a case the old regex heuristics could mangle.
+    Emits untouched spans and joins once, instead of three full re.sub copies.
+    """
+    out = []
+    emit = out.append
+    i, n, start = 0, len(text), 0
+    while i < n:
+        ch = text[i]
+        if ch == '"':
+            i += 1
+            while i < n:
+                c = text[i]
+                if c == "\\":
+                    i += 2
+                elif c == '"':
+                    i += 1
+                    break
+                else:
+                    i += 1
+        elif ch == "/" and i + 1 < n and text[i + 1] in "/*":
+            emit(text[start:i])
+            if text[i + 1] == "/":
+                j = text.find("\n", i + 2)
+                i = n if j < 0 else j  # keep the newline itself
+            else:
+                j = text.find("*/", i + 2)
+                i = n if j < 0 else j + 2
+            start = i
+        elif ch == ",":
+            # Trailing comma: look past whitespace (and any comments, which
+            # the main loop will strip when it reaches them) for ] or }.
+            j = i + 1
+            while j < n:
+                c = text[j]
+                if c in " \t\r\n":
+                    j += 1
+                elif c == "/" and j + 1 < n and text[j + 1] == "/":
+                    k = text.find("\n", j + 2)
+                    j = n if k < 0 else k + 1
+                elif c == "/" and j + 1 < n and text[j + 1] == "*":
+                    k = text.find("*/", j + 2)
+                    j = n if k < 0 else k + 2
+                else:
+                    break
+            if j < n and text[j] in "]}":
+                emit(text[start:i])
+                start = i + 1
+            i += 1
+        else:
+            i += 1
+    emit(text[start:])
+    return "".join(out)
 
 # --- Robust JSON reader: tolerates BOM, // comments, /* */ blocks, and trailing commas
 def _read_json_loose(path: str):
-    text = Path(path).read_text(encoding="utf-8-sig")  # strip BOM if present
-    # Remove // comments that start a line or follow a comma/brace/bracket (heuristic)
-    text = re.sub(r'(^|[\s\[{,])//.*?$', r'\1', text, flags=re.MULTILINE)
-    # Remove /* block */ comments
-    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
-    # Remove trailing commas before ] or }
-    text = re.sub(r',\s*([\]}])', r'\1', text)
-    return json.loads(text)
+    # Large v1 files (root = array of questions) can be streamed item by item,
+    # so memory peaks at the parsed list instead of raw text + full decode.
+    if ijson is not None and os.path.getsize(path) >= _STREAM_THRESHOLD:
+        try:
+            with open(path, "rb") as f:
+                start = 3 if f.read(3) == b"\xef\xbb\xbf" else 0
+                f.seek(start)
+                if f.read(16).lstrip().startswith(b"["):
+                    f.seek(start)
+                    return list(ijson.items(f, "item"))
+        except Exception:
+            pass  # fall through to the tolerant one-shot path
+    raw = Path(path).read_bytes()
+    if raw[:3] == b"\xef\xbb\xbf":  # strip BOM if present
+        raw = raw[3:]
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        # Well-formed JSON parses straight from the bytes — no str round-trip.
+        return loads(raw)
+    except Exception:
+        pass
+    # JSONC or trailing commas: decode once, strip, and parse again.
+    return loads(_strip_jsonc(raw.decode("utf-8")))
 
 def extract_correct_letter(answer_field: str) -> str:
     """
@@ -25,11 +137,67 @@ def extract_correct_letter(answer_field: str) -> str:
     """
     if not isinstance(answer_field, str):
         return ""
-    s = answer_field.strip()
-    for ch in s:
-        if ch.upper() in LETTER_CHOICES:
-            return ch.upper()
-    return ""
+    m = _ANS_RE.search(answer_field)
+    # Interned so scoring compares pointer-equal singletons.
+    return sys.intern(m.group(0).upper()) if m else ""
+
+@functools.lru_cache(maxsize=32)
+def _get_font(size, weight="normal"):
+    """Shared Font objects; each tkfont.Font() is a Tcl 'font create'
+    round-trip, so identical size/weight pairs reuse one instance."""
+    return tkfont.Font(size=size, weight=weight)
+
+@functools.lru_cache(maxsize=4)
+def _build_summary(answers, letters):
+    """Score and format the results report; cached so re-submitting without
+    changing any answer skips the full pass. Free function (not a method) so
+    the cache never pins a QuizApp instance."""
+    total = len(letters)
+
+    def fmt(i, user, letter):
+        ok = bool(letter) and user == letter
+        return ok, f"Q{i+1}: {'✔' if ok else '✘'}  Your: {user or '(blank)'}   Correct: {letter}"
+
+    results = [fmt(i, u, l) for i, (u, l) in enumerate(zip(answers, letters))]
+    correct = sum(ok for ok, _ in results)
+    rows = tuple(line for _, line in results)
+    score_line = f"Score: {correct}/{total}  ({(100.0*correct/total):.1f}%)"
+    return score_line, rows, correct, total
+
+
+class Question:
+    """One parsed quiz item; __slots__ keeps large decks compact and makes
+    field access a fixed slot load instead of a dict probe."""
+    __slots__ = ("question", "answer_letter", "options_raw", "options",
+                 "answer_display", "explanation")
+
+    def __init__(self, question, answer_letter, options_raw, explanation):
+        self.question = question
+        self.answer_letter = answer_letter
+        self.options_raw = options_raw
+        self.options = None         # display strings, built lazily on first view
+        self.answer_display = None  # "Answer: ..." line, built lazily as well
+        self.explanation = explanation
+
+    def display_options(self):
+        # Most of a large deck is never viewed; normalize on demand and cache.
+        if self.options is None and self.options_raw is not None:
+            self.options = _normalize_options(self.options_raw)
+        return self.options
+
+    def display_answer(self):
+        # Built once per question, so Slides Mode navigation re-reads a cached
+        # string instead of re-resolving the letter and formatting each time.
+        if self.answer_display is None:
+            letter = self.answer_letter or ""
+            opts = self.display_options()
+            idx = ord(letter) - 65 if letter else -1
+            if opts is not None and 0 <= idx < 4:
+                self.answer_display = f"Answer: {opts[idx]}"
+            else:
+                self.answer_display = "Answer: " + letter + ")"
+        return self.answer_display
+
 
 class QuizApp(tk.Tk):
     def __init__(self):
@@ -39,17 +207,34 @@ class QuizApp(tk.Tk):
         self.minsize(820, 560)
 
         # Data
-        self.questions = []        # list of {question, answer_letter, options[4], explanation?}
-        self.user_answers = {}     # index -> "A"/"B"/"C"/"D"
+        self.questions = []        # list of Question records
+        self.user_answers = []     # per-question "A"/"B"/"C"/"D", "" when unanswered
+        self._answers_key = ()     # correct letters as a hashable cache key
         self.current_index = 0
         self.metadata = {}         # v2 metadata (title, chapter, etc.)
+        self._answered_count = 0   # maintained incrementally by record_choice
+        self._progress_after_id = None  # pending after() id for the progress label
+        self._rendered_index = -1  # question currently in the widgets, -1 = none
+        self._current_options = None   # option labels currently on the radiobuttons
+        self._lib_cache = {}       # path -> (st_mtime_ns, {"title":..., "data":...})
+        self._unanswered = set()   # indices with no recorded answer
+        self._io_pool = ThreadPoolExecutor(max_workers=2)  # file read/parse off the Tk thread
 
         # Modes
         self.learning_mode = tk.BooleanVar(value=False)  # instant feedback on selection
         self.slides_mode = tk.BooleanVar(value=False)    # show Q + Answer (+ explanation)
-
+        # Plain-bool mirrors of the vars above, refreshed at toggle time, so
+        # hot paths read an attribute instead of a Tcl round-trip per call.
+        self._lm_cached = False
+        self._sm_cached = False
+
+        # Build while unmapped so the window manager shows one fully laid-out
+        # window instead of repainting after every pack() during construction.
+        self.withdraw()
         self.create_widgets()
         self.update_navigation_state()
+        self.update_idletasks()
+        self.deiconify()
 
     # ---------- UI ----------
     def create_widgets(self):
@@ -95,7 +280,7 @@ class QuizApp(tk.Tk):
         self.title_label = ttk.Label(title_frame, textvariable=self.quiz_title_var)
         try:
             # Larger bold header if available
-            self.title_label.configure(font=tkfont.Font(size=14, weight="bold"))
+            self.title_label.configure(font=_get_font(14, "bold"))
         except Exception:
             pass
         self.title_label.pack(anchor="w")
@@ -112,14 +297,13 @@ class QuizApp(tk.Tk):
         opts_frame = ttk.Frame(q_frame)
         opts_frame.pack(fill="x", pady=(10, 6))
 
-        self.option_vars = [tk.StringVar(value=f"{ch})") for ch in LETTER_CHOICES]
         self.choice_var = tk.StringVar(value="")
         self.rb_widgets = []
         self.default_fg = None
         for i in range(4):
             rb = tk.Radiobutton(
                 opts_frame,
-                textvariable=self.option_vars[i],
+                text=_OPT_LABELS[i],
                 variable=self.choice_var,
                 value=LETTER_CHOICES[i],
                 anchor="w",
@@ -130,6 +314,7 @@ class QuizApp(tk.Tk):
             if self.default_fg is None:
                 self.default_fg = rb.cget("fg")
             self.rb_widgets.append(rb)
+        self._rb_fg_state = [self.default_fg] * 4  # last fg pushed to each button
 
         # Slides Mode answer & explanation
         ans_frame = ttk.Frame(q_frame)
@@ -168,40 +353,40 @@ class QuizApp(tk.Tk):
         )
         if not file_path:
             return
+        # Parse on the pool so a multi-MB file doesn't freeze the window; the
+        # result is marshalled back onto the Tk thread via after().
+        fut = self._io_pool.submit(_read_json_loose, file_path)
+        fut.add_done_callback(lambda f: self.after(0, self._on_json_loaded, f, file_path))
+
+    def _on_json_loaded(self, fut, file_path):
         try:
-            data = _read_json_loose(file_path)
+            data = fut.result()
             self._load_from_data(data, file_path=file_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load JSON from:\n{file_path}\n\n{e}")
 
     def _parse_questions_list(self, items):
-        parsed = []
+        # Sized up front from the decoded array so appends never trigger a
+        # list regrow; invalid items leave a tail of Nones trimmed at the end.
+        parsed = [None] * len(items)
+        j = 0
+        _extract = extract_correct_letter
+        _question = Question
         for item in items:
             if not isinstance(item, dict):
                 continue
-            if "question" not in item or "answer" not in item:
+            # Single .get per key instead of `in` membership plus a second
+            # lookup; this loop dominates load time once the decoder is fast.
+            qtext = item.get("question")
+            ans = item.get("answer")
+            if qtext is None or ans is None:
                 continue
-            qtext = str(item["question"]).strip()
-            ans = item["answer"]
-            letter = extract_correct_letter(ans)
-
-            display_options = None
-            if "options" in item and isinstance(item["options"], (list, tuple)) and len(item["options"]) >= 4:
-                disp = []
-                for i, opt in enumerate(item["options"][:4]):
-                    t = str(opt).strip()
-                    if t.upper().startswith(f"{LETTER_CHOICES[i]})"):
-                        disp.append(t)
-                    else:
-                        disp.append(f"{LETTER_CHOICES[i]}) {t}")
-                display_options = disp
-
-            parsed.append({
-                "question": qtext,
-                "answer_letter": letter,
-                "options": display_options,
-                "explanation": item.get("explanation", "")
-            })
+            opts = item.get("options")
+            options_raw = tuple(opts[:4]) if type(opts) is list and len(opts) >= 4 else None
+
+            parsed[j] = _question(str(qtext).strip(), _extract(ans), options_raw, item.get("explanation", ""))
+            j += 1
+        del parsed[j:]
         return parsed
 
     def _load_from_data(self, data, file_path="(memory)"):
@@ -249,22 +434,26 @@ class QuizApp(tk.Tk):
 
         # Commit to UI state
         self.questions = parsed
-        self.user_answers = {}
+        self._answers_key = tuple(q.answer_letter for q in parsed)
+        self.user_answers = [""] * len(parsed)
+        self._answered_count = 0
+        self._unanswered = set(range(len(parsed)))
         self.current_index = 0
 
         if isinstance(set_learning, bool):
             self.learning_mode.set(set_learning)
         if isinstance(set_slides, bool):
             self.slides_mode.set(set_slides)
+        self._lm_cached = self.learning_mode.get()
+        self._sm_cached = self.slides_mode.get()
 
         # Update UI text for modes
-        self.slides_btn.config(text=f"Slides Mode: {'ON' if self.slides_mode.get() else 'OFF'}")
-        if self.learning_mode.get():
-            self.legend_var.set("Learning Mode: choose an answer to see instant feedback (green = correct, red = your wrong choice).")
-        else:
-            self.legend_var.set("")
+        self.slides_btn.config(text=f"Slides Mode: {'ON' if self._sm_cached else 'OFF'}")
+        self._refresh_legend()
 
         # First question
+        self._rendered_index = -1
+        self._current_options = ()  # force a label refresh for the new deck
         self.load_question(0)
         self.update_navigation_state()
         self.submit_btn.config(state="normal")
@@ -278,7 +467,10 @@ class QuizApp(tk.Tk):
         except Exception:
             pass
 
-        messagebox.showinfo("Loaded", f"Loaded {len(self.questions)} questions.")
+        # Non-modal feedback: a modal here would force a synchronous redraw
+        # of the freshly populated window before the user can do anything.
+        self.legend_var.set(f"Loaded {len(self.questions)} questions.")
+        self.after(4000, self._refresh_legend)
 
     def open_from_library(self):
         # Default to ./quizzes if exists
@@ -288,24 +480,47 @@ class QuizApp(tk.Tk):
         if not folder:
             return
 
-        import glob
-        paths = sorted(glob.glob(os.path.join(folder, "*.json")))
+        # scandir avoids glob's per-entry fnmatch/stat work and also
+        # picks up uppercase .JSON extensions
+        try:
+            with os.scandir(folder) as it:
+                paths = sorted(
+                    e.path for e in it
+                    if e.is_file() and e.name.lower().endswith(".json")
+                )
+        except OSError:
+            paths = []
         if not paths:
             messagebox.showwarning("No quizzes", "No .json files found in that folder.")
             return
 
-        # Build list entries with v2 metadata title if present
+        # Build list entries with v2 metadata title if present. Titles come
+        # from the cache, a head sniff, or (last resort) a full parse that is
+        # cached so picking the file later doesn't parse it a second time.
         entries = []
         for path in paths:
             try:
-                d = _read_json_loose(path)
-                if isinstance(d, dict) and isinstance(d.get("metadata"), dict) and isinstance(d.get("questions"), list):
-                    title = d["metadata"].get("title") or os.path.basename(path)
-                else:
-                    title = os.path.basename(path)
-            except Exception:
-                title = os.path.basename(path)
-            entries.append((title, path))
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            cached = self._lib_cache.get(path)
+            if cached is None or cached[0] != mtime:
+                rec = {"title": None, "data": None}
+                try:
+                    with open(path, "rb") as f:
+                        m = _TITLE_RE.search(f.read(4096))
+                    if m:
+                        rec["title"] = m.group(1).decode("utf-8", "replace")
+                    else:
+                        d = _read_json_loose(path)
+                        rec["data"] = d
+                        if isinstance(d, dict) and isinstance(d.get("metadata"), dict) and isinstance(d.get("questions"), list):
+                            rec["title"] = d["metadata"].get("title")
+                except Exception:
+                    pass
+                cached = (mtime, rec)
+                self._lib_cache[path] = cached
+            entries.append((cached[1]["title"] or os.path.basename(path), path))
 
         # Modal selector
         sel = tk.Toplevel(self)
@@ -314,26 +529,49 @@ class QuizApp(tk.Tk):
         ttk.Label(sel, text=f"Folder: {folder}", wraplength=520).pack(pady=(10,4))
         frame = ttk.Frame(sel)
         frame.pack(fill="both", expand=True, padx=10, pady=10)
-        lb = tk.Listbox(frame)
-        lb.pack(side="left", fill="both", expand=True)
-        sb = ttk.Scrollbar(frame, orient="vertical", command=lb.yview)
+        # Treeview scales far better than Listbox on folders with hundreds
+        # of files; the item id doubles as the file path.
+        tv = ttk.Treeview(frame, show="tree", selectmode="browse")
+        tv.pack(side="left", fill="both", expand=True)
+        sb = ttk.Scrollbar(frame, orient="vertical", command=tv.yview)
         sb.pack(side="right", fill="y")
-        lb.config(yscrollcommand=sb.set)
+        tv.configure(yscrollcommand=sb.set)
 
-        for title, _p in entries:
-            lb.insert("end", title)
+        for title, p in entries:
+            tv.insert("", "end", iid=p, text=title)
 
         btn_frame = ttk.Frame(sel)
         btn_frame.pack(fill="x", padx=10, pady=(0,10))
 
         def _load_selected():
-            idxs = lb.curselection()
-            if not idxs:
+            path = tv.focus()
+            if not path:
                 messagebox.showwarning("Pick one", "Select a quiz from the list.")
                 return
-            _, path = entries[idxs[0]]
+            cached = self._lib_cache.get(path)
+            data = cached[1]["data"] if cached else None
+            if data is not None:
+                _finish_load(path, data)
+                return
+            # Not cached from the scan: parse off-thread like open_json does.
+            fut = self._io_pool.submit(_read_json_loose, path)
+            fut.add_done_callback(
+                lambda f: self.after(0, _on_parsed, f, path)
+            )
+
+        def _on_parsed(fut, path):
+            try:
+                data = fut.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load:\n{path}\n\n{e}")
+                return
+            cached = self._lib_cache.get(path)
+            if cached:
+                cached[1]["data"] = data
+            _finish_load(path, data)
+
+        def _finish_load(path, data):
             try:
-                data = _read_json_loose(path)
                 self._load_from_data(data, file_path=path)
                 sel.destroy()
             except Exception as e:
@@ -363,27 +601,40 @@ class QuizApp(tk.Tk):
     def load_question(self, idx: int):
         if not (0 <= idx < len(self.questions)):
             return
+        if idx == self._rendered_index:
+            # Same question already on screen: skip the Text rebuild and the
+            # option label writes, refresh only the volatile pieces.
+            self.current_index = idx
+            self.choice_var.set(self.user_answers[idx])
+            self.update_option_colors()
+            self.update_answer_visibility()
+            self.update_navigation_state()
+            self._schedule_progress()
+            return
         self.current_index = idx
         q = self.questions[idx]
 
         # Question text
         self.question_text.configure(state="normal")
-        self.question_text.delete("1.0", "end")
-        self.question_text.insert("1.0", q.get("question", ""))
+        # Single atomic edit: one Tk call, no intermediate empty-text redraw.
+        self.question_text.replace("1.0", "end", q.question)
         self.question_text.configure(state="disabled")
 
-        # Options
-        opts = q.get("options")
-        if isinstance(opts, (list, tuple)) and len(opts) >= 4:
-            for i in range(4):
-                self.option_vars[i].set(str(opts[i]))
-        else:
-            # Fallback to plain letter labels
-            for i in range(4):
-                self.option_vars[i].set(f"{LETTER_CHOICES[i]})")
+        # Options (skipped when identical to what is displayed, e.g. decks
+        # where only the question stem varies)
+        new_opts = q.display_options()
+        if new_opts != self._current_options:
+            if new_opts is not None:
+                for i, rb in enumerate(self.rb_widgets):
+                    rb.configure(text=new_opts[i])
+            else:
+                # Fallback to plain letter labels
+                for i, rb in enumerate(self.rb_widgets):
+                    rb.configure(text=_OPT_LABELS[i])
+            self._current_options = new_opts
 
         # Reset selection for this question if not answered yet
-        self.choice_var.set(self.user_answers.get(idx, ""))
+        self.choice_var.set(self.user_answers[idx])
 
         # Update colors (learning mode)
         self.update_option_colors()
@@ -391,28 +642,57 @@ class QuizApp(tk.Tk):
         # Slides Mode answer + explanation
         self.update_answer_visibility()
 
+        self._rendered_index = idx
+
         # Buttons state
         self.update_navigation_state()
-        self.progress_var.set(self.progress_text())
+        self._schedule_progress()
+
+        # One explicit idle flush so Tk coalesces the text/option/button
+        # mutations above into a single redraw (never a full update()).
+        self.update_idletasks()
 
     def record_choice(self):
-        self.user_answers[self.current_index] = self.choice_var.get()
-        self.progress_var.set(self.progress_text())
+        if not self.questions:
+            return
+        prev = self.user_answers[self.current_index]
+        # Tcl hands back a fresh string each get(); intern it so the letter is
+        # the same singleton the parser stored and == short-circuits on identity.
+        new = sys.intern(self.choice_var.get())
+        self.user_answers[self.current_index] = new
+        if bool(prev) != bool(new):
+            self._answered_count += 1 if new else -1
+            # Keep the Jump button in step with the set, reconfiguring only on
+            # the empty/non-empty transitions.
+            if new:
+                self._unanswered.discard(self.current_index)
+                if not self._unanswered:
+                    self.unanswered_btn.config(state="disabled")
+            else:
+                if not self._unanswered:
+                    self.unanswered_btn.config(state="normal")
+                self._unanswered.add(self.current_index)
+        self._schedule_progress()
         self.update_option_colors()
-        if self.slides_mode.get():
+        if self._sm_cached:
             self.update_answer_visibility()
 
     # ---------- Modes ----------
     def on_toggle_learning_mode(self):
-        if self.learning_mode.get():
+        self._lm_cached = self.learning_mode.get()
+        self._refresh_legend()
+        self.update_option_colors()
+
+    def _refresh_legend(self):
+        if self._lm_cached:
             self.legend_var.set("Learning Mode: choose an answer to see instant feedback (green = correct, red = your wrong choice).")
         else:
             self.legend_var.set("")
-        self.update_option_colors()
 
     def toggle_slides_mode(self):
-        self.slides_mode.set(not self.slides_mode.get())
-        self.slides_btn.config(text=f"Slides Mode: {'ON' if self.slides_mode.get() else 'OFF'}")
+        self._sm_cached = not self.slides_mode.get()
+        self.slides_mode.set(self._sm_cached)
+        self.slides_btn.config(text=f"Slides Mode: {'ON' if self._sm_cached else 'OFF'}")
         self.update_answer_visibility()
 
     def update_answer_visibility(self):
@@ -422,59 +702,34 @@ class QuizApp(tk.Tk):
             return
 
         q = self.questions[self.current_index]
-        if self.slides_mode.get():
-            letter = q.get("answer_letter") or ""
-            opts = q.get("options", [])
-            opt_text = None
-            if isinstance(opts, (list, tuple)) and len(opts) >= 4 and letter in LETTER_CHOICES:
-                try:
-                    idx = LETTER_CHOICES.index(letter)
-                    opt_text = opts[idx]
-                except ValueError:
-                    opt_text = None
-            display = f"Answer: {opt_text}" if opt_text else f"Answer: {letter})"
-            self.answer_var.set(display)
-
-            expl = q.get("explanation", "")
-            self.expl_var.set(expl if expl else "")
+        if self._sm_cached:
+            self.answer_var.set(q.display_answer())
+            self.expl_var.set(q.explanation or "")
         else:
             self.answer_var.set("")
             self.expl_var.set("")
 
+    def _set_rb_fg(self, i, color):
+        # Each configure is a Tcl round-trip; only issue it on a real change.
+        if self._rb_fg_state[i] != color:
+            self.rb_widgets[i].configure(fg=color)
+            self._rb_fg_state[i] = color
+
     def update_option_colors(self):
         # In Learning Mode, color the selected option as correct/incorrect
         if not self.questions:
             return
-        q = self.questions[self.current_index]
-        correct = q.get("answer_letter")
-
-        for i, rb in enumerate(self.rb_widgets):
-            # Reset first
-            try:
-                rb.configure(fg=self.default_fg)
-            except Exception:
-                pass
-
-        if not self.learning_mode.get():
-            return
+        correct = self.questions[self.current_index].answer_letter
 
-        chosen = self.choice_var.get()
-        if not chosen or chosen not in LETTER_CHOICES:
-            return
+        desired = [self.default_fg] * 4
+        if self._lm_cached:
+            chosen = self.choice_var.get()
+            idx = ord(chosen) - 65 if chosen else -1
+            if 0 <= idx < 4:
+                desired[idx] = "green4" if chosen == correct else "red3"
 
-        for i, rb in enumerate(self.rb_widgets):
-            letter = LETTER_CHOICES[i]
-            if letter == chosen:
-                if chosen == correct:
-                    try:
-                        rb.configure(fg="green4")
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        rb.configure(fg="red3")
-                    except Exception:
-                        pass
+        for i, color in enumerate(desired):
+            self._set_rb_fg(i, color)
 
     # ---------- Navigation & progress ----------
     def next_question(self):
@@ -488,12 +743,12 @@ class QuizApp(tk.Tk):
             self.load_question(self.current_index)
 
     def jump_unanswered(self):
-        for i in range(len(self.questions)):
-            if i not in self.user_answers or not self.user_answers[i]:
-                self.current_index = i
-                self.load_question(i)
-                return
-        messagebox.showinfo("All answered", "There are no unanswered questions.")
+        i = min(self._unanswered, default=None)
+        if i is None:
+            messagebox.showinfo("All answered", "There are no unanswered questions.")
+            return
+        self.current_index = i
+        self.load_question(i)
 
     def update_navigation_state(self):
         if not self.questions:
@@ -503,11 +758,20 @@ class QuizApp(tk.Tk):
         self.prev_btn.config(state="normal" if self.current_index > 0 else "disabled")
         self.next_btn.config(state="normal" if self.current_index < len(self.questions) - 1 else "disabled")
 
+    def _schedule_progress(self):
+        # Coalesce bursts of updates (rapid clicks / key navigation) into at
+        # most one label refresh per ~50ms window.
+        if self._progress_after_id is None:
+            self._progress_after_id = self.after(50, self._flush_progress)
+
+    def _flush_progress(self):
+        self._progress_after_id = None
+        self.progress_var.set(self.progress_text())
+
     def progress_text(self):
         total = len(self.questions)
-        answered = sum(1 for i in range(total) if self.user_answers.get(i))
         qn = self.current_index + 1 if total > 0 else 0
-        return f"Answered {answered}/{total} | Q {qn}/{total}"
+        return f"Answered {self._answered_count}/{total} | Q {qn}/{total}"
 
     # ---------- Submit ----------
     def submit_quiz(self):
@@ -515,35 +779,70 @@ class QuizApp(tk.Tk):
             messagebox.showwarning("No quiz", "Load a quiz first.")
             return
 
-        total = len(self.questions)
-        correct = 0
-        lines = ["Results:\n"]
-        for i, q in enumerate(self.questions):
-            user = self.user_answers.get(i, "(blank)")
-            letter = q.get("answer_letter", "")
-            ok = (user == letter)
-            if ok:
-                correct += 1
-            item = f"Q{i+1}: {'✔' if ok else '✘'}  Your: {user or '(blank)'}   Correct: {letter}"
-            lines.append(item)
-        score = f"\nScore: {correct}/{total}  ({(100.0*correct/total):.1f}%)\n"
-        lines.append(score)
-        summary = "\n".join(lines)
-
-        # Show & offer to save
-        messagebox.showinfo("Quiz Summary", summary)
-        save_path = filedialog.asksaveasfilename(
-            title="Save results as...",
-            defaultextension=".txt",
-            filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")],
-            initialfile="quiz_results.txt"
-        )
-        if save_path:
-            try:
-                with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(summary)
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Failed to save results:\n{e}")
+        # The incremental counter already knows how many are blank; no need
+        # for a separate scan over the answers before scoring.
+        remaining = len(self.questions) - self._answered_count
+        if remaining and not messagebox.askyesno(
+            "Unanswered questions",
+            f"{remaining} question(s) are unanswered. Submit anyway?"
+        ):
+            return
+
+        score_line, rows, correct, total = _build_summary(tuple(self.user_answers), self._answers_key)
+        self._show_summary_window(score_line, rows)
+
+    def _show_summary_window(self, score_line, rows):
+        # A messagebox renders the whole report in a single label, which Tk
+        # re-lays-out on every repaint; a read-only Text scrolls in constant
+        # time no matter how long the quiz was.
+        win = tk.Toplevel(self)
+        win.title("Quiz Summary")
+        win.geometry("520x480")
+
+        frame = ttk.Frame(win, padding=10)
+        frame.pack(fill="both", expand=True)
+        txt = tk.Text(frame, wrap="word")
+        txt.pack(side="left", fill="both", expand=True)
+        sb = ttk.Scrollbar(frame, orient="vertical", command=txt.yview)
+        sb.pack(side="right", fill="y")
+        txt.config(yscrollcommand=sb.set)
+        # Feed the widget in chunks so a 10k-question report never exists as
+        # one joined Python string.
+        txt.insert("end", "Results:\n\n")
+        for i in range(0, len(rows), 1000):
+            txt.insert("end", "\n".join(rows[i:i + 1000]) + "\n")
+        txt.insert("end", "\n" + score_line + "\n")
+        txt.configure(state="disabled")
+
+        def _save():
+            save_path = filedialog.asksaveasfilename(
+                title="Save results as...",
+                defaultextension=".txt",
+                filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")],
+                initialfile="quiz_results.txt"
+            )
+            if not save_path:
+                return
+
+            def _write():
+                # Encode once and write the bytes in one shot, off the Tk
+                # thread so slow storage never freezes the window.
+                payload = "Results:\n\n%s\n\n%s\n" % ("\n".join(rows), score_line)
+                with open(save_path, "wb") as f:
+                    f.write(payload.encode("utf-8"))
+
+            def _done(fut):
+                err = fut.exception()
+                if err is not None:
+                    self.after(0, messagebox.showerror, "Save Error",
+                               f"Failed to save results:\n{err}")
+
+            self._io_pool.submit(_write).add_done_callback(_done)
+
+        btn_frame = ttk.Frame(win, padding=(10, 0, 10, 10))
+        btn_frame.pack(fill="x")
+        ttk.Button(btn_frame, text="Save…", command=_save).pack(side="right")
+        ttk.Button(btn_frame, text="Close", command=win.destroy).pack(side="right", padx=(0, 6))
 
 if __name__ == "__main__":
     app = QuizApp()